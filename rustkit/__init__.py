@@ -28,16 +28,20 @@ as of now, only the following features are implemented:
 """
 
 from .error import UnwrapError
-from .option import Option, some, none
-from .result import Result, ok, err
+from .option import Option, Some, None_, some, none
+from .result import Result, Ok, Err, ok, err
 
 
 __all__ = (
     "UnwrapError",
     "Option",
+    "Some",
+    "None_",
     "some",
     "none",
     "Result",
+    "Ok",
+    "Err",
     "ok",
     "err",
 )
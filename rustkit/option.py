@@ -35,6 +35,13 @@ of a value and take action, always accounting for the [`None`] case.
     >>> else:
     >>>     print("Cannot divide by 0")
 
+    >>> # or, on 3.10+, match it against the [`Some`] and [`None_`] patterns
+    >>> match result:
+    ...     case Some(value):
+    ...         print(f"Result: {value}")
+    ...     case None_():
+    ...         print("Cannot divide by 0")
+
     >>> User = type("User", (), {"id": 0})
     >>> def get_user(id: int) -> Option[User]:
     ...     db = ...
@@ -73,6 +80,8 @@ These methods transform [`Option`] to [`Result`]:
 * [`map`] transforms [`Option[T]`] to [`Option[U]`] by applying the provided function to the
   contained value of [`Some`] and
   leaving [`None`] values unchanged
+* [`map_many`] is [`map`] applied with several functions in turn, without building the
+  intermediate [`Option`]s
 
 #### These methods transform [`Option[T]`] to a value of a possibly different type `U`:
 
@@ -121,6 +130,7 @@ The [`and_then`] and [`or_else`] methods take a function as input, and
 only evaluate the function when they need to produce a new value. Only
 the [`and_then`] method can produce an [`Option[U]`] value having a
 different inner type `U` than [`Option[T]`].
+[`and_then_many`] chains several [`and_then`] calls in one.
 
 ```md
 | method       | self      | function input | function result | output    |
@@ -178,7 +188,6 @@ from types import NoneType
 from typing import (
     Callable,
     Generic,
-    TYPE_CHECKING,
     Tuple,
     TypeVar,
     Optional,
@@ -187,9 +196,6 @@ from typing import (
 
 from .error import UnwrapError
 
-if TYPE_CHECKING:
-    from .result import Result, ok, err
-
 
 class SupportsRichComparison(Protocol):
     def __eq__(self, other: object) -> bool:
@@ -219,8 +225,34 @@ R = TypeVar("R", bound="Result")
 C = TypeVar("C", bound=SupportsRichComparison)
 
 
+class _Missing:
+    """the value of an empty option. `None` can't mark it, because `some(None)` holds `None`.
+
+    there is only ever one, copying or unpickling it gives back `_MISSING` itself,
+    so empty options stay empty after `copy.deepcopy` and `pickle`.
+    """
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+    def __copy__(self) -> _Missing:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _Missing:
+        return self
+
+    def __repr__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+
 __all__ = (
     "Option",
+    "Some",
+    "None_",
     "some",
     "none",
 )
@@ -247,27 +279,25 @@ class Option(Generic[T]):
     * Nullable variables
     * Swapping things out of difficult situations
     """
-    __value: T | None
-    __slots__ = ("__value",)
+    _v: T | _Missing
+    """T: value of the Option object, `_MISSING` when the option is none"""
+    __slots__ = ("_v",)
 
     ###########################################################################
     # Creating the option type
     ###########################################################################
 
-    def __init__(self, value: Optional[T] = None, *, _force: bool = False) -> None:
+    def __init__(self, value: Optional[T] = None) -> None:
         """Try not to directly initialize the option type. There are better ways.
 
         such as: the module level functions [`none`] and [`some`],
-        or the class methods [`Option.none`] and [`Option.some`]
+        or the class methods [`Option.none`] and [`Option.some`],
+        which allocate options without calling `__init__` at all.
         """
-        if not _force:
-            raise RuntimeError(
-                "you may not create the option type directly. \n"
-                "instead use one of the provided factory methods"
-            )
-
-        self.__value = value
-        """T: value of the Option object"""
+        raise RuntimeError(
+            "you may not create the option type directly. \n"
+            "instead use one of the provided factory methods"
+        )
 
     @classmethod
     def from_(cls, value: T | NoneType) -> Option[T]:
@@ -279,17 +309,18 @@ class Option(Generic[T]):
         >>> assert Option[int].from_(f()) == Option.none()
         >>> assert Option[int].from_(f()) == Option.some(1)
         """
-        return cls(value, _force=True)
+        return none() if value is None else some(value)
 
     @classmethod
     def some(cls, value: T) -> Option[T]:
-        """create an [`Option`] from a value that you know for sure that is not [`None`]
-        if you're not sure about the value being some, use [`Option.from_`]
+        """create an [`Option`] that holds `value`, even if it is [`None`].
+        if [`None`] should mean no value, use [`Option.from_`]
 
         Examples:
             >>> assert Option.some(1) == Option.from_(1)
+            >>> assert Option.some(None) != Option.from_(None)
         """
-        return cls(value, _force=True)
+        return some(value)
 
     @classmethod
     def none(cls) -> Option[T]:
@@ -298,7 +329,7 @@ class Option(Generic[T]):
         Examples:
             >>> assert Option.none().is_none()
         """
-        return cls(None, _force=True)
+        return none()
 
     ###########################################################################
     # Querying the contained values
@@ -314,7 +345,7 @@ class Option(Generic[T]):
             >>> x: Option[int] = none()
             >>> assert x.is_some() == False
         """
-        return self.__value is not None
+        return self._v is not _MISSING
 
     def is_some_and(self: Option[T], func: Callable[[T], bool]) -> bool:
         """Check if the option is has `Some` value and that value satisfies the given predicate.
@@ -329,7 +360,7 @@ class Option(Generic[T]):
             >>> x: Option[int] = none()
             >>> assert x.is_some_and(lambda val: val > 1) == False
         """
-        return func(self.__value) if self.is_some() else False
+        return self._v is not _MISSING and func(self._v)
 
     def is_none(self) -> bool:
         """Returns `True` if the option has [`None`] value.
@@ -341,7 +372,7 @@ class Option(Generic[T]):
             >>> x: Option[int] = none()
             >>> assert x.is_none() == True
         """
-        return not self.is_some()
+        return self._v is _MISSING
 
     ###########################################################################
     # Getting to contained values
@@ -369,10 +400,10 @@ class Option(Generic[T]):
             >>> id_ = Option.from_({"id": 10}.get("id"))
             >>> item = id_.expect("dict should contain key `id`")
         """
-        if self.is_none():
+        if self._v is _MISSING:
             raise UnwrapError(msg)
 
-        return self.__value
+        return self._v
 
     def unwrap(self: Option[T]) -> T:
         """Returns the contained [`Some`] value, consuming the `self` value.
@@ -392,10 +423,10 @@ class Option(Generic[T]):
             >>> x: Option[str] = none()
             >>> assert x.unwrap() == "air"  # raises UnwrapError
         """
-        if self.is_none():
+        if self._v is _MISSING:
             raise UnwrapError("called `Option.unwrap()` on a `None` value")
 
-        return self.__value
+        return self._v
 
     def unwrap_or(self: Option[T], default: T) -> T:
         """Returns the contained [`Some`] value or a provided default.
@@ -407,10 +438,10 @@ class Option(Generic[T]):
             >>> assert some("car").unwrap_or("bike") == "car"
             >>> assert none().unwrap_or("bike") == "bike"
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return default
 
-        return self.__value
+        return self._v
 
     def unwrap_or_else(self: Option[T], func: Callable[[], T]) -> T:
         """Returns the contained [`Some`] value or computes it from a function.
@@ -419,10 +450,10 @@ class Option(Generic[T]):
             >>> assert some(4).unwrap_or_else(int) == 4
             >>> assert none().unwrap_or_else(int) == 0
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return func()
 
-        return self.__value
+        return self._v
 
     ###########################################################################
     # Transforming contained values
@@ -436,10 +467,28 @@ class Option(Generic[T]):
              >>> maybe_len = maybe_string.map(len)
              >>> assert maybe_len == Option(13)
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return self
 
-        return Option.some(func(self.__value))
+        return some(func(self._v))
+
+    def map_many(self: Option[T], *funcs: Callable) -> Option:
+        """Maps an `Option[T]` through each function of `funcs` in turn,
+        the same as chaining [`map`] calls, but without the intermediate options.
+
+        Examples:
+            >>> assert some("Hello").map_many(len, str) == some("5")
+            >>> assert some(1).map_many(lambda _: None, str) == some("None")
+            >>> assert none().map_many(len, str) == none()
+        """
+        value = self._v
+        if value is _MISSING:
+            return self
+
+        for func in funcs:
+            value = func(value)
+
+        return some(value)
 
     def inspect(self: Option[T], func: Callable[[T], None]) -> Option[T]:
         """Calls the provided closure with a reference to the contained value (if [`Some`]).
@@ -453,8 +502,8 @@ class Option(Generic[T]):
             >>> x: Option[int] = id_.inspect(lambda val: print(f"got: {val}"))
             ... # does not print anything
         """
-        if self.is_some():
-            func(self.__value)
+        if self._v is not _MISSING:
+            func(self._v)
         return self
 
     def map_or(self: Option[T], default: U, func: Callable[[T], U]) -> U:
@@ -473,10 +522,10 @@ class Option(Generic[T]):
             >>> x: Option[str] = none()
             >>> assert x.map_or(-1, len) == -1
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return default
 
-        return func(self.__value)
+        return func(self._v)
 
     def map_or_else(self: Option[T], default: Callable[[], U], func: Callable[[T], U]) -> U:
         """Computes a default function result (if none), or
@@ -491,10 +540,10 @@ class Option(Generic[T]):
             >>> x: Option[str] = none()
             >>> assert x.map_or_else(int, len) == 0  # default for calling int()
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return default()
 
-        return func(self.__value)
+        return func(self._v)
 
     def ok_or(self: Option[T], error: E) -> Result[T, E]:
         """Transforms the `Option[T]` into a [`Result[T, E]`],
@@ -511,12 +560,10 @@ class Option(Generic[T]):
             >>> x: Option[str] = none()
             >>> assert x.ok_or(0) == err(0)
         """
-        from .result import ok, err as _err
+        if self._v is _MISSING:
+            return err(error)
 
-        if self.is_none():
-            return _err(error)
-
-        return ok(self.__value)
+        return ok(self._v)
 
     def ok_or_else(self: Option[T], func: Callable[[], E]) -> Result[T, E]:
         """Transforms the `Option[T]` into a [`Result[T, E]`], mapping [`Some(T)`] to [`Ok(T)`]
@@ -531,12 +578,10 @@ class Option(Generic[T]):
             >>> x: Option[str] = none()
             >>> assert x.ok_or_else(int) == err(0)
         """
-        from .result import ok, err
-
-        if self.is_none():
+        if self._v is _MISSING:
             return err(func())
 
-        return ok(self.__value)
+        return ok(self._v)
 
     ###########################################################################
     # Boolean operations on the values, eager and lazy
@@ -566,13 +611,13 @@ class Option(Generic[T]):
             >>> y = none()
             >>> assert x.and_(y) == Option()
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return self
 
         return rhs
 
-    def __and__(self: Option[T], rhs: Option[U]) -> Option[T] | Option[U]:
-        return self.and_(rhs)
+    # `&`, `|` and `^` are the methods themselves, not wrappers that call them
+    __and__ = and_
 
     def and_then(self: Option[T], func: Callable[[T], Option[U]]) -> Option[U]:
         """Returns [`None`] if the option is [`None`], otherwise calls `func`
@@ -585,10 +630,29 @@ class Option(Generic[T]):
             >>> i = Option.from_(10).and_then(lambda ten: Option.from_(ten / 2))
             >>> assert i == Option(5.0)
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return self
 
-        return func(self.__value)
+        return func(self._v)
+
+    def and_then_many(self: Option[T], *funcs: Callable[..., Option]) -> Option:
+        """Returns [`None`] if the option is [`None`], otherwise feeds the wrapped value through
+        each function of `funcs` in turn, stopping at the first one that returns [`None`],
+        the same as chaining [`and_then`] calls.
+
+        Examples:
+            >>> half = lambda x: some(x // 2) if x % 2 == 0 else none()
+            >>> assert some(8).and_then_many(half, half) == some(2)
+            >>> assert some(6).and_then_many(half, half) == none()
+        """
+        opt = self
+        for func in funcs:
+            if opt._v is _MISSING:
+                break
+
+            opt = func(opt._v)
+
+        return opt
 
     def filter(self: Option[T], func: Callable[[T], bool]) -> Option[T]:
         """Returns [`None`] if the option is [`None`], otherwise calls `func`
@@ -625,7 +689,7 @@ class Option(Generic[T]):
             >>> assert some(3).filter(is_even) == none()
             >>> assert some(4).filter(is_even) == some(4)
         """
-        if self.is_some() and func(self.__value):
+        if self._v is not _MISSING and func(self._v):
             return self
 
         return none()
@@ -653,13 +717,12 @@ class Option(Generic[T]):
             >>> y = none()
             >>> assert x.or_(y) == none()
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return rhs
 
         return self
 
-    def __or__(self: Option[T], rhs: Option[U]) -> Option[T] | Option[U]:
-        return self.or_(rhs)
+    __or__ = or_
 
     def or_else(self: Option[T], func: Callable[[], Option[T]]) -> Option[T]:
         """Returns the option if it contains a value, otherwise calls `func` and
@@ -673,7 +736,7 @@ class Option(Generic[T]):
             >>> assert none().or_else(vikings) == some("vikings")
             >>> assert none().or_else(nobody) == none()
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return func()
 
         return self
@@ -709,45 +772,46 @@ class Option(Generic[T]):
             >>> assert x.xor(y) == none()
         """
 
-        if self.is_none():
-            if rhs.is_none():
+        if self._v is _MISSING:
+            if rhs._v is _MISSING:
                 return none()
 
             return rhs
 
-        if rhs.is_none():
+        if rhs._v is _MISSING:
             return self
 
         return none()
 
-    def __xor__(self: Option[T], rhs: Option[T]) -> Option[T]:
-        return self.xor(rhs)
+    __xor__ = xor
 
     ###########################################################################
     # Comparison operators
     ###########################################################################
 
     def __eq__(self: Option[T], rhs: Option[T] | NoneType) -> bool:
-        if isinstance(rhs, Option):
+        if rhs is None:
+            return self._v is _MISSING
+
+        if type(rhs) is Option:
             # rhs is an option
-            if self.is_none() and rhs.is_none():
-                # both are none
-                return True
-            elif (self.is_some() and rhs.is_none()) or (self.is_none() and rhs.is_some()):
-                # either is none
-                return False
-            else:
-                # both are some
-                # compare values
-                return self.__value == rhs.__value
+            value, rhs_value = self._v, rhs._v
+            if value is _MISSING or rhs_value is _MISSING:
+                # both are none, or either is none.
+                # not left to `==`, the payload may itself compare equal to the sentinel
+                return value is rhs_value
 
-        if rhs is None:
-            return self.is_none()
+            # both are some
+            # compare values
+            return value == rhs_value
 
-        raise TypeError(f"Cannot compare Option with {rhs.__class__.__name__}")
+        # options are hashable, so comparing with anything else must not raise:
+        # dicts and sets compare keys whose hashes collide.
+        return NotImplemented
 
     def __ne__(self: Option[T], rhs: Option[T] | NoneType) -> bool:
-        return not self.__eq__(rhs)
+        eq = self.__eq__(rhs)
+        return eq if eq is NotImplemented else not eq
 
     # def __lt__(self: Option[C], rhs: Option[C] | NoneType) -> bool:
     #     if isinstance(rhs, Option):
@@ -764,7 +828,7 @@ class Option(Generic[T]):
     #         else:
     #             # both are some
     #             # compare values
-    #             return self.__value < rhs.__value
+    #             return self._v < rhs._v
     #
     #     if rhs is None:
     #         return False
@@ -786,7 +850,7 @@ class Option(Generic[T]):
     #         else:
     #             # both are some
     #             # compare values
-    #             return self.__value <= rhs.__value
+    #             return self._v <= rhs._v
     #
     #     if rhs is None:
     #         return self.is_none()
@@ -808,7 +872,7 @@ class Option(Generic[T]):
     #         else:
     #             # both are some
     #             # compare values
-    #             return self.__value > rhs.__value
+    #             return self._v > rhs._v
     #
     #     if rhs is None:
     #         # S > N
@@ -831,7 +895,7 @@ class Option(Generic[T]):
     #         else:
     #             # both are some
     #             # compare values
-    #             return self.__value >= rhs.__value
+    #             return self._v >= rhs._v
     #
     #     if rhs is None:
     #         return True
@@ -858,10 +922,10 @@ class Option(Generic[T]):
             >>> val = a.insert(2)
             >>> assert val == 2
         """
-        self.__value = value
+        self._v = value
 
-        # Safety: we just set the value up top, so self.__value can never be None.
-        return self.__value
+        # Safety: we just set the value up top, so the option is always some here.
+        return self._v
 
     def get_or_insert(self: Option[T], value: T) -> T:
         """Inserts `value` into the option if it is [`None`], then returns the contained value.
@@ -872,10 +936,12 @@ class Option(Generic[T]):
 
             >>> assert some(10).get_or_insert(5) == 10
         """
-        if self.is_none():
-            self.__value = value
+        current = self._v
+        if current is _MISSING:
+            self._v = value
+            return value
 
-        return self.__value
+        return current
 
     def get_or_insert_with(self: Option[T], func: Callable[[], T]) -> T:
         """Inserts a value computed from `func` into the option if it is [`None`],
@@ -885,10 +951,12 @@ class Option(Generic[T]):
             >>> y = none().get_or_insert_with(int)
             >>> assert y == 0
         """
-        if self.is_none():
-            self.__value = func()
+        current = self._v
+        if current is _MISSING:
+            self._v = value = func()
+            return value
 
-        return self.__value
+        return current
 
     ###########################################################################
     # Miscellaneous
@@ -908,10 +976,10 @@ class Option(Generic[T]):
             >>> assert x == none()
             >>> assert y == none()
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return self
 
-        self.__value, value = None, self.__value
+        self._v, value = _MISSING, self._v
         return some(value)
 
     def replace(self: Option[T], value: T) -> Option[T]:
@@ -930,8 +998,8 @@ class Option(Generic[T]):
             >>> assert x == some(3)
             >>> assert old == none()
         """
-        self.__value, old_value = value, self.__value
-        return Option.some(old_value) if old_value is not None else Option.none()
+        self._v, old_value = value, self._v
+        return none() if old_value is _MISSING else some(old_value)
 
     def contains(self: Option[T], value: T) -> bool:
         """Returns `True` if the option contains a value equal to the given value.
@@ -947,7 +1015,8 @@ class Option(Generic[T]):
             >>> assert not x.contains(0)
             >>> assert 0 not in x
         """
-        return self.__value == value
+        current = self._v
+        return current is not _MISSING and (current is value or current == value)
 
     def zip(self: Option[T], option: Option[U]) -> Option[Tuple[T, U]]:
         """Zips `self` with another `Option`.
@@ -962,10 +1031,11 @@ class Option(Generic[T]):
             >>> assert x.zip(y) == some((1, "hi"))
             >>> assert x.zip(z) == none()
         """
-        if self.is_some() and option.is_some():
-            return Option.some((self.__value, option.__value))
+        value, rhs_value = self._v, option._v
+        if value is not _MISSING and rhs_value is not _MISSING:
+            return some((value, rhs_value))
 
-        return Option.none()
+        return none()
 
     def zip_with(self: Option[T], rhs: Option[U], func: Callable[[T, U], V]) -> Option[V]:
         """Zips `self` and another `Option` with function `func`.
@@ -984,10 +1054,11 @@ class Option(Generic[T]):
             >>> assert x.zip_with(y, Point) == some(Point(17.5, 42.7))
             >>> assert x.zip_with(none(), Point) == none()
         """
-        if self.is_some() and rhs.is_some():
-            return Option.some(func(self.__value, rhs.__value))
+        value, rhs_value = self._v, rhs._v
+        if value is not _MISSING and rhs_value is not _MISSING:
+            return some(func(value, rhs_value))
 
-        return Option.none()
+        return none()
 
     def transpose(self: Option[Result[T, E]]) -> Result[Option[T], E]:
         """Transposes an [`Option`] of a [`Result`] into a [`Result`] of an [`Option`].
@@ -1003,21 +1074,15 @@ class Option(Generic[T]):
             >>> y: Option[Result[int, Exception]] = some(ok(5))
             >>> assert x == y.transpose()
         """
-        from .result import Result, ok, err
+        value = self._v
+        if value is _MISSING:
+            return ok(none())
 
-        if not isinstance(self.__value, (Result, NoneType)):
+        if not isinstance(value, Result):
             raise TypeError("Option must contain a Result when using transpose")
 
-        if self.is_some_and(Result.is_ok):
-            # Safety: we are sure that self.__value is not err because we checked it above.
-            return ok(some(self.__value.unwrap()))
-
-        if self.is_some_and(Result.is_err):
-            # Safety: we are sure that self.__value is not ok because we checked it above.
-            return err(self.__value.unwrap_err())
-
-        if self.is_none():
-            return ok(none())
+        is_ok, inner = value._unpack()
+        return ok(some(inner)) if is_ok else err(inner)
 
     def flatten(self: Option[Option[T]]) -> Option[T]:
         """Converts from `Option[Option[T]]` to `Option[T]`.
@@ -1038,10 +1103,10 @@ class Option(Generic[T]):
         >>> assert x.flatten() == some(some(6))
         >>> assert x.flatten().flatten() == some(6)
         """
-        if self.is_none():
+        if self._v is _MISSING:
             return self
 
-        return self.__value
+        return self._v
 
     ###########################################################################
     # Pythonic implementation
@@ -1050,18 +1115,77 @@ class Option(Generic[T]):
     @classmethod
     @functools.cache
     def __class_getitem__(cls: Option[T], item: T) -> Option[T]:
-        if isinstance(item, type):
-            return cls
-        raise TypeError("Option can only be used as a generic type")
+        # `Option[T, U]` passes its parameters as a single tuple
+        if isinstance(item, tuple):
+            raise TypeError("Option takes exactly one type parameter: Option[T]")
 
-    def __contains__(self: Option[T], value: T) -> bool:
-        return self.contains(value)
+        # like `Result`, any typing form is accepted, not just plain classes
+        return cls
+
+    __contains__ = contains
+
+    def __hash__(self: Option[T]) -> int:
+        """Hashes `none()` like [`None`], which it equals, and [`Some(T)`] by its value,
+        kept apart from the hash of the bare value, which it never equals.
+
+        the hash changes with the value, so do not `insert` into or `take` from
+        an option while it is used as a `dict` key or kept in a `set`.
+        """
+        value = self._v
+        return hash(None) if value is _MISSING else hash((Option, value))
 
     def __repr__(self: Option[T]) -> str:
-        return f"<Option({self.__value})>" if self.is_some() else "<Option(None)>"
+        value = self._v
+        if value is _MISSING:
+            return "<Option(None)>"
+
+        if value is None:
+            # `some(None)` holds a value, keep it apart from the empty option above
+            return "<Option(Some(None))>"
+
+        return f"<Option({value!r})>"
 
     def __bool__(self: Option[T]) -> bool:
-        return self.is_some()
+        return self._v is not _MISSING
+
+
+class _SomeMeta(type):
+    def __instancecheck__(cls, instance: object) -> bool:
+        return type(instance) is Option and instance._v is not _MISSING
+
+
+class _NoneMeta(type):
+    def __instancecheck__(cls, instance: object) -> bool:
+        return type(instance) is Option and instance._v is _MISSING
+
+
+class Some(metaclass=_SomeMeta):
+    """The [`Some(T)`] pattern, matches an [`Option`] that contains a value.
+
+    Examples:
+        >>> match some(1):
+        ...     case Some(value):
+        ...         assert value == 1
+    """
+    __slots__ = ()
+    __match_args__ = ("_v",)
+
+    def __new__(cls, *args, **kwargs):
+        raise RuntimeError("`Some` is only a pattern, use `some` to create an option")
+
+
+class None_(metaclass=_NoneMeta):
+    """The [`None`] pattern, matches an [`Option`] that does not contain a value.
+
+    Examples:
+        >>> match none():
+        ...     case None_():
+        ...         pass
+    """
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        raise RuntimeError("`None_` is only a pattern, use `none` to create an option")
 
 
 def some(value: T) -> Option[T]:
@@ -1077,7 +1201,10 @@ def some(value: T) -> Option[T]:
         >>> x = some(2)
         >>> assert x.is_some()
     """
-    return Option.some(value)
+    # `Option.__init__` only refuses direct construction, so set the slot ourselves
+    opt = object.__new__(Option)
+    opt._v = value
+    return opt
 
 
 def none() -> Option[T]:
@@ -1090,4 +1217,13 @@ def none() -> Option[T]:
         >>> x = none()
         >>> assert x.is_none()
     """
-    return Option.none()
+    # options can be filled in place (`insert`, `replace`, ...), so every
+    # `none()` is a fresh object; it just skips `__init__` to stay cheap.
+    opt = object.__new__(Option)
+    opt._v = _MISSING
+    return opt
+
+
+# result.py imports `Option`, `some` and `none` from this module at its top,
+# so it can only be imported once they exist, that is, down here.
+from .result import Result, ok, err  # noqa: E402
@@ -33,6 +33,18 @@ When writing code that calls many functions that return the
 In addition to working with pattern matching, [`Result`] provides a
 wide variety of different methods.
 
+### Pattern matching
+
+[`Ok`] and [`Err`] are the variant classes, so a [`Result`] can be
+destructured with `match`:
+
+>>> match ok(10):
+...     case Ok(value):
+...         print(value)
+...     case Err(error):
+...         raise error
+10
+
 ### Querying the variant
 
 The [`is_ok`] and [`is_err`] methods return [`True`] if the [`Result`]
@@ -150,8 +162,9 @@ collect a [`Result`] from an function call.
 """
 
 from __future__ import annotations
-import asyncio as aio
 import functools
+from inspect import CO_COROUTINE
+from types import BuiltinFunctionType, FunctionType
 from typing import (
     Any,
     Callable,
@@ -161,9 +174,11 @@ from typing import (
     Coroutine,
 )
 from .error import UnwrapError
+# option.py only imports this module at its bottom, once these names are defined
+from .option import Option, some, none
 
 if TYPE_CHECKING:
-    from .option import Option, some, none
+    import asyncio as aio
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -172,9 +187,14 @@ E = TypeVar("E")
 R = TypeVar("R", bound="Result")
 Arg = TypeVar("Arg")
 
+_UNWRAP_MSG = "called `Result.unwrap` on an `Err` value"
+_UNWRAP_ERR_MSG = "called `Result.unwrap_err` on an `Ok` value"
+
 
 __all__ = (
     "Result",
+    "Ok",
+    "Err",
     "ok",
     "err",
 )
@@ -186,26 +206,31 @@ class Result(Generic[T, E]):
     [`Result[T,] E]` is the type used for returning and propagating errors.
     It is an enum with the variants, [`Ok(T)`] representing success and containing a value,
     and [`Err(E)`] representing error and containing an error value.
+
+    every result is an instance of one of the two variant subclasses,
+    [`Ok`] or [`Err`], which carry the variant flag on the class instead of on
+    every instance.
     """
     __is_ok: bool
+    """bool: class level variant flag, set by `Ok` and `Err`"""
     __value: T | E
-    __slots__ = ("__is_ok", "__value")
+    __slots__ = ("__value",)
 
     ###########################################################################
     # Creating the Result objects
     ###########################################################################
 
-    def __init__(self: Result[T, E], is_ok: bool, value: T, *, _force: bool = False) -> None:
+    def __init__(self: Result[T, E], *args, **kwargs) -> None:
         """DO NOT DIRECTLY INITIALIZE THE RESULT TYPE!!!
-        """
-        if not _force:
-            raise RuntimeError(
-                "you may not create the result type directly. \n"
-                "instead use one of the provided factory methods"
-            )
 
-        self.__is_ok = is_ok
-        self.__value = value
+        [`ok`] and [`err`] allocate results without calling `__init__`,
+        so the only thing left for it to do is refuse direct construction,
+        whatever it is called with, `Result(...)`, `Ok(...)` or `Err(...)`.
+        """
+        raise RuntimeError(
+            "you may not create the result type directly. \n"
+            "instead use one of the provided factory methods"
+        )
 
     @classmethod
     def from_(
@@ -228,7 +253,8 @@ class Result(Generic[T, E]):
         Args:
             func: the function to call
             *args: the arguments to pass to the function
-            loop: the event loop to use for the coroutine, default to the current running loop
+            loop: the event loop to use for the coroutine. defaults to a private event loop
+                that is closed afterwards; the thread's current event loop is not touched
             **kwargs: the keyword arguments to pass to the function
 
         Raises:
@@ -238,14 +264,44 @@ class Result(Generic[T, E]):
             [`Result[T, E]`]
             if the function returns a value, returns `ok(T)`
             if the function raises an exception, returns `err(E)`
+            a coroutine given while an event loop is already running is not run,
+            and returns `err(RuntimeError)`
         """
+        # fast path for builtins, classes and plain (undecorated, non async) functions,
+        # which are by far the most common, without paying for the asyncio probes below.
+        func_type = type(func)
+        if func_type is BuiltinFunctionType or func_type is type or (
+                func_type is FunctionType
+                and not func.__code__.co_flags & CO_COROUTINE
+                and not func.__dict__
+        ):
+            try:
+                return ok(func(*args, **kwargs))
+            except Exception as e:
+                return err(e)
+
+        import asyncio as aio
+
         if aio.iscoroutinefunction(func):
             func = func(*args, **kwargs)
 
         if aio.iscoroutine(func):
-            loop = loop or aio.get_event_loop()
             try:
-                return ok(loop.run_until_complete(func))
+                aio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                # no loop can be driven from inside a running one, don't leave the coroutine dangling
+                func.close()
+                return err(RuntimeError(
+                    "Result.from_ cannot run a coroutine inside a running event loop, await it instead"
+                ))
+
+            try:
+                if loop is not None:
+                    return ok(loop.run_until_complete(func))
+
+                return ok(_run_on_private_loop(func))
             except Exception as e:
                 return err(e)
 
@@ -277,7 +333,7 @@ class Result(Generic[T, E]):
             >>> x = ok(2)
             >>> assert x.is_ok_and(lambda i: i == 2)
         """
-        if self.is_err():
+        if not self.__is_ok:
             return False
 
         return func(self.__value)
@@ -298,7 +354,7 @@ class Result(Generic[T, E]):
             >>> x = err("Nothing here")
             >>> assert x.is_err_and(lambda i: i == "Nothing here")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return False
 
         return func(self.__value)
@@ -316,7 +372,7 @@ class Result(Generic[T, E]):
             >>> x = ok(2)
             >>> assert x.map(lambda i: i + 1) == ok(3)
         """
-        if self.is_ok():
+        if self.__is_ok:
             return ok(func(self.__value))
 
         return self
@@ -336,7 +392,7 @@ class Result(Generic[T, E]):
 
             >>> assert err(0).map_or(0, lambda i: i + 1) == 0
         """
-        if self.is_ok():
+        if self.__is_ok:
             return func(self.__value)
 
         return default
@@ -350,7 +406,7 @@ class Result(Generic[T, E]):
             >>> x = ok(2)
             >>> assert x.map_or_else(int, lambda i: i + 1) == 3
         """
-        if self.is_ok():
+        if self.__is_ok:
             return func(self.__value)
 
         return default(self.__value)
@@ -364,7 +420,7 @@ class Result(Generic[T, E]):
             >>> x = err("Nothing here")
             >>> assert x.map_err(lambda i: i + " again") == err("Nothing here again")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self
 
         return err(func(self.__value))
@@ -378,7 +434,7 @@ class Result(Generic[T, E]):
             >>> x = ok(2)
             >>> assert x.inspect(lambda i: print(i)) == ok(2)
         """
-        if self.is_ok():
+        if self.__is_ok:
             func(self.__value)
 
         return self
@@ -392,7 +448,7 @@ class Result(Generic[T, E]):
             >>> x = err("Nothing here")
             >>> assert x.inspect_err(print) == err("Nothing here")
         """
-        if self.is_err():
+        if not self.__is_ok:
             func(self.__value)
 
         return self
@@ -408,8 +464,7 @@ class Result(Generic[T, E]):
             >>> x = ok(2)
             >>> assert x.ok() == some(2)
         """
-        from .option import some, none
-        return some(self.__value) if self.is_ok() else none()
+        return some(self.__value) if self.__is_ok else none()
 
     def err(self: Result[T, E]) -> Option[E]:
         """Returns [`Some(E)`] if the result is [`Err(E)`], otherwise [`None`].
@@ -418,8 +473,7 @@ class Result(Generic[T, E]):
             >>> x = err("Nothing here")
             >>> assert x.err() == some("Nothing here")
         """
-        from .option import some, none
-        return none() if self.is_ok() else some(self.__value)
+        return none() if self.__is_ok else some(self.__value)
 
     def expect(self: Result[T, E], msg: str) -> T:
         """Unwraps a result, yielding the content of an [`Ok(T)`.]
@@ -441,7 +495,7 @@ class Result(Generic[T, E]):
         Raises:
             UnwrapError: If the value is an [`Err(E)`.]
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self.__value
 
         if isinstance(self.__value, Exception):
@@ -464,7 +518,7 @@ class Result(Generic[T, E]):
         Raises:
             UnwrapError: If the value is an [`Ok(T)`].
         """
-        if self.is_ok():
+        if self.__is_ok:
             if isinstance(self.__value, Exception):
                 raise UnwrapError(msg) from self.__value
 
@@ -488,13 +542,13 @@ class Result(Generic[T, E]):
         Raises:
             UnwrapError: If the value is an [`Err(E)`.] or an instance of `Exception`.
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self.__value
 
         if isinstance(self.__value, Exception):
-            raise UnwrapError("called `Result.unwrap` on an `Err` value") from self.__value
+            raise UnwrapError(_UNWRAP_MSG) from self.__value
 
-        raise UnwrapError("called `Result.unwrap` on an `Err` value")
+        raise UnwrapError(_UNWRAP_MSG)
 
     def unwrap_err(self: Result[T, E]) -> E:
         """Returns the contained [`Err`] value, consuming the `self` value.
@@ -509,11 +563,11 @@ class Result(Generic[T, E]):
         Raises:
             UnwrapError: If the value is an [`Ok(T)`].
         """
-        if self.is_ok():
+        if self.__is_ok:
             if isinstance(self.__value, Exception):
-                raise UnwrapError("called `Result.unwrap_err` on an `Ok` value") from self.__value
+                raise UnwrapError(_UNWRAP_ERR_MSG) from self.__value
 
-            raise UnwrapError("called `Result.unwrap_err` on an `Ok` value")
+            raise UnwrapError(_UNWRAP_ERR_MSG)
 
         return self.__value
 
@@ -532,7 +586,7 @@ class Result(Generic[T, E]):
             >>> x = err("Nothing here")
             >>> assert x.unwrap_or(3) == 3
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self.__value
 
         return default
@@ -544,7 +598,7 @@ class Result(Generic[T, E]):
             >>> assert ok(2).unwrap_or_else(len) == 2
             >>> assert err("foo").unwrap_or_else(len) == 3
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self.__value
 
         return func(self.__value)
@@ -570,10 +624,10 @@ class Result(Generic[T, E]):
             >>> assert x.and_(ok(3)) == err("Nothing here")
             >>> assert x.and_(err("Nothing here")) == err("Nothing here")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return rhs
 
-        return err(self.__value)
+        return self
 
     def __and__(self: Result[T, E], rhs: Result[T, E]):
         return self.and_(rhs)
@@ -595,10 +649,10 @@ class Result(Generic[T, E]):
             >>> assert ok(2).and_then(err_).and_then(sq) == err("Nothing here")
             >>> assert err("Nothing here").and_then(sq).and_then(sq) == err("Nothing here")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return func(self.__value)
 
-        return err(self.__value)
+        return self
 
     def filter(self: Result[T, E], predicate: Callable[[T], bool]) -> Result[T, E]:
         """Returns `self` if the result is [`Ok(T)`] and
@@ -618,13 +672,10 @@ class Result(Generic[T, E]):
             >>> assert ok(3).filter(is_even) == err(3)
             >>> assert err(3).filter(is_even) == err(3)
         """
-        if self.is_ok():
-            if predicate(self.__value):
-                return ok(self.__value)
-
-            return err(self.__value)
+        if self.__is_ok:
+            return self if predicate(self.__value) else err(self.__value)
 
-        return err(self.__value)
+        return self
 
     def or_(self: Result[T, E], rhs: Result[T, V]) -> Result[T, V]:
         """Returns `res` if the result is [`Err(E)`] otherwise returns the [`Ok(T)`] value of `self`.
@@ -643,7 +694,7 @@ class Result(Generic[T, E]):
             >>> assert x.or_(ok(3)) == ok(3)
             >>> assert x.or_(err("Nothing here")) == err("Nothing here")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self
 
         return rhs
@@ -668,8 +719,8 @@ class Result(Generic[T, E]):
             >>> assert ok(2).or_else(err_).or_else(sq) == ok(2)
             >>> assert err(-1).or_else(sq).or_else(err_) == ok(4)
         """
-        if self.is_ok():
-            return ok(self.__value)
+        if self.__is_ok:
+            return self
 
         return func(self.__value)
 
@@ -678,14 +729,16 @@ class Result(Generic[T, E]):
     ###########################################################################
 
     def __eq__(self: Result[T, E], rhs: Result[T, E]) -> bool:
+        if self is rhs:
+            return True
+
+        if type(rhs) is type(self):
+            # both are err or both are ok
+            return self.__value == rhs.__value
+
         if isinstance(rhs, Result):
-            # rhs is a Result
-            if (self.is_err() and rhs.is_err()) or (self.is_ok() and rhs.is_ok()):
-                # both are err or both are ok
-                return self.__value == rhs.__value
-            elif (self.is_ok() and rhs.is_err()) or (self.is_err() and rhs.is_ok()):
-                # either is error
-                return False
+            # either is error
+            return False
 
         raise TypeError(f"Cannot compare Result with {rhs.__class__.__name__}")
 
@@ -753,7 +806,7 @@ class Result(Generic[T, E]):
             >>> assert not ok(2).contains(3)
             >>> assert not err("Nothing here").contains(2)
         """
-        return self.is_ok() and self.__value == x
+        return self.__is_ok and self.__value == x
 
     def contains_err(self: Result[T, E], x: E) -> bool:
         """Returns `True` if the result is [`Err(E)`] and
@@ -764,7 +817,7 @@ class Result(Generic[T, E]):
             >>> assert not err("Nothing here").contains_err("Nothing")
             >>> assert not ok(2).contains_err("Nothing here")
         """
-        return self.is_err() and self.__value == x
+        return not self.__is_ok and self.__value == x
 
     def transpose(self: Result[Option[T], E]) -> Option[Result[T, E]]:
         """Transposes a `Result[Option(T), E]` into an `Option[Result[T, E]]`.
@@ -773,27 +826,21 @@ class Result(Generic[T, E]):
             >>> assert ok(some(2)).transpose() == some(ok(2))
             >>> assert ok(none()).transpose() == none()
         """
-        from .option import Option, some, none
-        self.__value: Option[T]
+        value: Option[T] = self.__value
 
-        # Ok(Some(x)) => Some(Ok(x))
-        if self.is_ok_and(lambda val: isinstance(val, Option) and val.is_some()):
-            # Safety: it's safe to unwrap because we checked that the value is some above
-            return some(ok(self.__value.unwrap()))
+        if type(value) is not Option:
+            raise TypeError("Result must contain an Option when using transpose")
 
         # Ok(None) => None
-        if self.is_ok_and(lambda val: isinstance(val, Option) and val.is_none()):
+        # Err(None) => None
+        if value.is_none():
             return none()
 
-        if self.is_err_and(lambda val: isinstance(val, Option)):
-            if self.__value.is_some():
-                # Err(Some(x)) => Some(Err(x))
-                return some(err(self.__value.unwrap()))
-
-            # Err(None) => None
-            return none()
-
-        raise TypeError("Result must contain an Option when using transpose")
+        # Ok(Some(x)) => Some(Ok(x))
+        # Err(Some(x)) => Some(Err(x))
+        # Safety: it's safe to unwrap because we checked that the value is some above
+        inner = value.unwrap()
+        return some(ok(inner) if self.__is_ok else err(inner))
 
 
     def flatten(self: Result[Result[T, E], E]) -> Result[T, E]:
@@ -804,7 +851,7 @@ class Result(Generic[T, E]):
             >>> assert ok(err("Nothing here")).flatten() == err("Nothing here")
             >>> assert err("Nothing here").flatten() == err("Nothing here")
         """
-        if self.is_ok():
+        if self.__is_ok:
             return self.__value
 
         return self
@@ -815,20 +862,76 @@ class Result(Generic[T, E]):
 
     @classmethod
     @functools.cache
-    def __class_getitem__(cls: Option[T], ok_: T, err_: E) -> Option[T]:
-        if (isinstance(ok_, type) and isinstance(err_, type)) or (isinstance(ok_, ...) ^ isinstance(err_, ...)):
-            return cls
+    def __class_getitem__(cls, params: tuple[type[T], type[E]]) -> type[Result[T, E]]:
+        # `Result[T, E]` passes its parameters as a single tuple
+        if not isinstance(params, tuple) or len(params) != 2:
+            raise TypeError("Result takes exactly two type parameters: Result[T, E]")
 
-        raise TypeError("Result can only be used as a generic type")
+        # the parameters themselves are not checked, so unions, TypeVars, generic aliases
+        # and forward references all work, just like they do with `Generic`.
+        return cls
 
     def __contains__(self: Result[T, E], item: T | E) -> bool:
         return self.contains(item) or self.contains_err(item)
 
     def __repr__(self: Result[T, E]) -> str:
-        return f"<Ok({self.__value})>" if self.is_ok() else f"<Err({self.__value})>"
+        return f"<Ok({self.__value!r})>" if self.__is_ok else f"<Err({self.__value!r})>"
 
     def __bool__(self: Result[T, E]) -> bool:
-        return self.is_ok()
+        return self.__is_ok
+
+    def _unpack(self: Result[T, E]) -> tuple[bool, T | E]:
+        """internal: the variant flag and the contained value in one call,
+        without re-checking the variant like `unwrap` / `unwrap_err` do.
+        used by `Option.transpose`, so option.py never touches the private slots.
+        """
+        return self.__is_ok, self.__value
+
+
+class Ok(Result):
+    """The [`Ok(T)`] variant of [`Result`], create it with [`ok`]."""
+    __slots__ = ()
+    __match_args__ = ("_Result__value",)
+    _Result__is_ok = True
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_err(self) -> bool:
+        return False
+
+    def map(self: Result[T, E], func: Callable[[T], U]) -> Result[U, E]:
+        return ok(func(self._Result__value))
+
+    def unwrap(self: Result[T, E]) -> T:
+        return self._Result__value
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class Err(Result):
+    """The [`Err(E)`] variant of [`Result`], create it with [`err`]."""
+    __slots__ = ()
+    __match_args__ = ("_Result__value",)
+    _Result__is_ok = False
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_err(self) -> bool:
+        return True
+
+    def map(self: Result[T, E], func: Callable[[T], U]) -> Result[U, E]:
+        return self
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# results are never mutated, so the unit `Ok(None)` can be shared
+_OK_NONE = object.__new__(Ok)
+_OK_NONE._Result__value = None
 
 
 def ok(value: T) -> Result[T, E]:
@@ -839,7 +942,13 @@ def ok(value: T) -> Result[T, E]:
         >>> assert ok(2) != ok(3)
         >>> assert ok(2) != err("Nothing here")
     """
-    return Result(True, value, _force=True)
+    if value is None:
+        return _OK_NONE
+
+    # `Result.__init__` only refuses direct construction, so set the slot ourselves
+    res = object.__new__(Ok)
+    res._Result__value = value
+    return res
 
 
 def err(value: E) -> Result[T, E]:
@@ -850,4 +959,32 @@ def err(value: E) -> Result[T, E]:
         >>> assert err("Nothing here") != err("Nothing")
         >>> assert err("Nothing here") != ok(2)
     """
-    return Result(False, value, _force=True)
+    # `Result.__init__` only refuses direct construction, so set the slot ourselves
+    res = object.__new__(Err)
+    res._Result__value = value
+    return res
+
+
+def _run_on_private_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Runs `coro` on a new event loop that is never made the thread's current loop,
+    so unlike `asyncio.run`, whatever loop the caller has set stays in place.
+
+    afterwards the loop is cleaned up the way `asyncio.run` does it, and always closed.
+    """
+    import asyncio as aio
+
+    loop = aio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            tasks = aio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(aio.gather(*tasks, return_exceptions=True))
+
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
@@ -1,3 +1,8 @@
+import copy
+import pickle
+import typing
+from typing import TypeVar
+
 import pytest
 
 from rustkit import *
@@ -16,6 +21,7 @@ from rustkit import *
 # test unwrap_or_else
 
 # test map
+# test map_many
 # test inspect
 # test map_or
 # test map_or_else
@@ -25,6 +31,7 @@ from rustkit import *
 # test and_
 # test __and__
 # test and_then
+# test and_then_many
 # test filter
 # test or_
 # test __or__
@@ -43,13 +50,17 @@ from rustkit import *
 # test replace
 # test contains
 # test __contains__
+# test __hash__
 # test zip
 # test zip_with
 # test transpose
 # test flatten
 
+# test __class_getitem__
 # test __repr__
 # test __bool__
+# test match
+# test copy and pickle
 
 
 def test_from_():
@@ -63,12 +74,25 @@ def test_from_():
 def test_some():
     assert Option.some(1) == some(1)
 
+    # some(None) is a real value, unlike Option.from_(None)
+    assert some(None).is_some()
+    assert some(None) != none()
+    assert some(None) == some(None)
+    assert some(None) != None
+    assert some(None).unwrap() is None
+    assert some(1).map(lambda x: None) == some(None)
+
 
 def test_none():
     assert Option.none() == none()
     assert Option.none() == none()
     assert Option.none() == None
 
+    # none() may be filled in place, so it must never be shared
+    x = none()
+    x.insert(1)
+    assert none().is_none()
+
 
 
 def test_is_some():
@@ -117,6 +141,13 @@ def test_map():
     assert none().map(lambda x: x + 1) == none()
 
 
+def test_map_many():
+    assert some(1).map_many(lambda x: x + 1, str) == some("2")
+    assert some(1).map_many(lambda x: None, str) == some("None")
+    assert some(1).map_many() == some(1)
+    assert none().map_many(lambda x: x + 1, str) == none()
+
+
 def test_inspect():
     assert some(1).inspect(lambda x: x + 1) == some(1)
     assert none().inspect(lambda x: x + 1) == none()
@@ -164,6 +195,12 @@ def test_and_then():
     assert none().and_then(lambda x: none()) == none()
 
 
+def test_and_then_many():
+    assert some(1).and_then_many(lambda x: some(x + 1), lambda x: some(str(x))) == some("2")
+    assert some(1).and_then_many(lambda x: none(), lambda x: some(str(x))) == none()
+    assert none().and_then_many(lambda x: some(x + 1)) == none()
+
+
 def test_filter():
     assert some(1).filter((1).__eq__) == some(1)
     assert some(1).filter((2).__eq__) == none()
@@ -210,9 +247,11 @@ def test___xor__():
 def test___eq__():
     assert Option.some(1) == some(1)
     assert none() == none()
+    assert some(none()) != none()
+    assert some(None) != none()
 
-    with pytest.raises(TypeError):
-        _ = Option.some(1) == 1
+    assert not Option.some(1) == 1
+    assert not 1 == Option.some(1)
 
 
 def test___ne__():
@@ -220,8 +259,8 @@ def test___ne__():
     assert some(1) != none()
     assert some(1) != some(2)
 
-    with pytest.raises(TypeError):
-        _ = Option.some(1) != 1
+    assert Option.some(1) != 1
+    assert 1 != Option.some(1)
 
 
 
@@ -262,6 +301,9 @@ def test_contains():
     assert not none().contains(1)
     assert not none().contains(2)
 
+    nan = float("nan")
+    assert some(nan).contains(nan)
+
 
 def test___contains__():
     assert 1 in some(1)
@@ -270,6 +312,22 @@ def test___contains__():
     assert 2 not in none()
 
 
+def test___hash__():
+    assert hash(some(1)) == hash(some(1))
+    assert hash(none()) == hash(None)
+    assert len({some(1), some(1), none(), none()}) == 2
+    assert {none(): 1}[None] == 1
+    assert hash(some(1)) != hash(1)
+
+    # a value and its option can share a container
+    assert len({1, some(1)}) == 2
+    assert {1: "a", some(1): "b"}[some(1)] == "b"
+
+    # colliding hashes are compared, that must not raise
+    assert len({hash(None): "a", none(): "b"}) == 2
+    assert len({(Option, 1): "a", some(1): "b"}) == 2
+
+
 def test_zip():
     assert some(1).zip(some(2)) == some((1, 2))
     assert some(1).zip(none()) == none()
@@ -301,12 +359,65 @@ def test_flatten():
 
 
 
+def test___class_getitem__():
+    T = TypeVar("T")
+    assert Option[int] is Option
+    assert Option[int | str] is Option
+    assert Option[list[int]] is Option
+    assert Option[T] is Option
+    assert Option["Foo"] is Option
+
+    with pytest.raises(TypeError):
+        _ = Option[int, str]
+
+    assert typing.get_type_hints(Option.transpose)
+    assert typing.get_type_hints(Option.zip)
+
+
 def test___repr__():
     assert repr(some(1)) == "<Option(1)>"
     assert repr(some(some(1))) == "<Option(<Option(1)>)>"
     assert repr(none()) == "<Option(None)>"
+    assert repr(some(None)) == "<Option(Some(None))>"
+    assert repr(some("1")) == "<Option('1')>"
 
 
 def test___bool__():
     assert bool(some(1))
     assert not bool(none())
+
+
+def test_match():
+    match some(1):
+        case Some(value):
+            assert value == 1
+        case _:
+            assert False
+
+    match none():
+        case Some(_):
+            assert False
+        case None_():
+            pass
+        case _:
+            assert False
+
+    assert isinstance(some(1), Some)
+    assert not isinstance(none(), Some)
+    assert isinstance(none(), None_)
+    assert not isinstance(1, Some)
+
+    with pytest.raises(RuntimeError):
+        Some(1)
+
+
+def test_copy_and_pickle():
+    for opt in (none(), some(None), some(none()), some(1)):
+        for clone in (copy.copy(opt), copy.deepcopy(opt), pickle.loads(pickle.dumps(opt))):
+            assert clone == opt
+            assert clone.is_some() == opt.is_some()
+
+    assert copy.deepcopy(none()).is_none()
+    assert pickle.loads(pickle.dumps(none())).is_none()
+    assert copy.deepcopy(some(None)).unwrap() is None
+    assert pickle.loads(pickle.dumps(some(none()))).unwrap().is_none()
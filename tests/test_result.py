@@ -1,3 +1,7 @@
+import asyncio
+import typing
+from typing import Optional, TypeVar
+
 import pytest
 
 from rustkit import *
@@ -44,8 +48,10 @@ from rustkit import *
 # transpose
 # flatten
 
+# test __class_getitem__
 # test __repr__
 # test __bool__
+# test match
 
 
 def test_from_():
@@ -63,6 +69,39 @@ def test_from_():
     assert Result.from_(bad).is_err()
     assert Result.from_(bad()).is_err()
 
+    loop = asyncio.new_event_loop()
+    assert Result.from_(good, loop=loop).is_ok()
+    assert Result.from_(bad(), loop=loop).is_err()
+
+    # without `loop=`, the thread's current event loop is left in place
+    asyncio.set_event_loop(loop)
+    try:
+        assert Result.from_(good).is_ok()
+        assert Result.from_(bad()).is_err()
+        assert asyncio.get_event_loop() is loop
+        assert not loop.is_closed()
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    # leftover tasks on the private loop are cancelled, not leaked
+    leftover = []
+
+    async def spawn():
+        leftover.append(asyncio.ensure_future(asyncio.sleep(60)))
+        return 1
+
+    assert Result.from_(spawn) == ok(1)
+    assert leftover[0].cancelled()
+
+    # a coroutine can't be driven from inside a running loop, that is an err, not a crash
+    async def main():
+        return Result.from_(good), Result.from_(good(), loop=asyncio.get_running_loop())
+
+    for res in asyncio.run(main()):
+        assert res.is_err()
+        assert isinstance(res.unwrap_err(), RuntimeError)
+
     assert Result.from_(lambda: 1/0).is_err()
 
     assert Result.from_(sum, (1, 2, 3)).is_ok()
@@ -77,6 +116,7 @@ def test_from_():
 def test_ok():
     assert ok(10).is_ok()
     assert ok(10).unwrap() == 10
+    assert ok(None) is ok(None)
 
 
 def test_err():
@@ -240,6 +280,9 @@ def test___eq__():
     assert ok(10) == ok(10)
     assert err(10) == err(10)
 
+    x = ok(float("nan"))
+    assert x == x
+
     with pytest.raises(TypeError):
         assert ok(10) == 10
 
@@ -287,11 +330,58 @@ def test_flatten():
 
 
 
+def test___class_getitem__():
+    assert Result[int, str] is Result
+    assert Result[int, ...] is Result
+
+    with pytest.raises(TypeError):
+        _ = Result[int]
+
+    with pytest.raises(TypeError):
+        _ = Result[int, str, bytes]
+
+    # any typing form, not just plain classes
+    T = TypeVar("T")
+    assert Result[int, ValueError | TypeError] is Result
+    assert Result[Optional[int], str] is Result
+    assert Result[list[int], str] is Result
+    assert Result[T, str] is Result
+    assert Result["Foo", str] is Result
+
+    # the library's own annotations can be evaluated
+    assert typing.get_type_hints(Result.map)
+    assert typing.get_type_hints(Result.transpose)
+
+
 def test___repr__():
     assert repr(ok(10)) == "<Ok(10)>"
     assert repr(err(10)) == "<Err(10)>"
+    assert repr(ok("10")) == "<Ok('10')>"
 
 
 def test___bool__():
     assert bool(ok(10))
     assert not bool(err(10))
+
+
+def test_match():
+    match ok(10):
+        case Ok(value):
+            assert value == 10
+        case _:
+            assert False
+
+    match err(10):
+        case Ok(_):
+            assert False
+        case Err(error):
+            assert error == 10
+
+    assert isinstance(ok(10), Ok)
+    assert isinstance(err(10), Err)
+
+    with pytest.raises(RuntimeError):
+        Ok(1)
+
+    with pytest.raises(RuntimeError):
+        Err(1)